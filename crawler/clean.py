@@ -7,6 +7,8 @@ import sys
 import shutil
 import subprocess
 import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
@@ -14,6 +16,8 @@ try:
 except ImportError:
     psycopg2 = None
 
+CLEANUP_WORKERS = 8
+
 
 def run_cmd(cmd, cwd=None):
     """Run shell command."""
@@ -27,9 +31,11 @@ def run_cmd(cmd, cwd=None):
         return None
 
 
+@functools.lru_cache(maxsize=1)
 def docker_available():
     """Check if Docker is available."""
-    return run_cmd(['docker', '--version']) and run_cmd(['docker', '--version']).returncode == 0
+    result = run_cmd(['docker', '--version'])
+    return bool(result) and result.returncode == 0
 
 
 def stop_containers():
@@ -91,10 +97,17 @@ def cleanup_containers():
     
     containers = ['document_postgres', 'document_crawler', 'document_importer', 'document_pgadmin']
     
+    # One `docker ps` (name filters are OR-ed) and one `docker rm` for all containers
+    filters = [arg for container in containers for arg in ('--filter', f'name={container}')]
+    result = run_cmd(['docker', 'ps', '-a', '--format', '{{.Names}}', *filters])
+    existing = set(result.stdout.split()) if result else set()
+    found = [container for container in containers if container in existing]
+    
+    if found:
+        run_cmd(['docker', 'rm', '-f', *found])
+    
     for container in containers:
-        result = run_cmd(['docker', 'ps', '-a', '-q', '--filter', f'name={container}'])
-        if result and result.stdout.strip():
-            run_cmd(['docker', 'rm', '-f', container])
+        if container in existing:
             print(f"Removed container: {container}")
         else:
             print(f"Container not found: {container}")
@@ -118,7 +131,8 @@ def remove_local_database():
         'port': 5432,
         'database': 'postgres',  # Connect to postgres database to drop document_index
         'user': 'postgres',
-        'password': 'postgres'
+        'password': 'postgres',
+        'connect_timeout': 2  # Fail fast when no server is listening
     }
     
     db_name = 'document_index'
@@ -177,14 +191,21 @@ def clear_dir(dir_path, desc):
             print("  Already empty.")
             return True
         
-        for item in items:
+        def warn(func, path, exc_info):
+            print(f"  Warning: Failed to remove {Path(path).name}: {exc_info[1]}")
+        
+        def remove(item):
+            if item.is_dir() and not item.is_symlink():
+                shutil.rmtree(item, onerror=warn)
+                return
             try:
-                if item.is_file() or item.is_symlink():
-                    item.unlink()
-                else:
-                    shutil.rmtree(item)
-            except Exception as e:
-                print(f"  Warning: Failed to remove {item.name}: {e}")
+                item.unlink()
+            except OSError:
+                warn(item.unlink, item, sys.exc_info())
+        
+        # unlink/rmdir release the GIL, so threads overlap slow filesystem calls
+        with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+            list(executor.map(remove, items))
         
         print(f"  Removed {len(items)} items.")
         return True
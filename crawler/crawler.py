@@ -2,22 +2,40 @@
 # -*- coding: utf-8 -*-
 """Document Crawler - extracts text from documents and archives."""
 
+import io
 import os
+import sys
+import re
 import csv
+import queue
 import tempfile
+import threading
 import shutil
 import hashlib
+import logging
+import logging.handlers
+import mmap
+import multiprocessing
+import sqlite3
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 
 from docx import Document
-import openpyxl
+from python_calamine import CalamineWorkbook
 import xlrd
 import PyPDF2
-import pdfplumber
+import pypdfium2 as pdfium
 import zipfile
 
+logger = logging.getLogger('crawler')
+LOG_FORMAT = '%(message)s'
+LOG_BUFFER_SIZE = 1024
+PROGRESS_INTERVAL = 0.5  # seconds between progress bar refreshes
+
 try:
     import py7zr
     SEVENZIP_AVAILABLE = True
@@ -32,35 +50,80 @@ except ImportError:
     RARFILE_AVAILABLE = False
     print("Warning: rarfile not available. RAR archives will not be processed.")
 
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
 SUPPORTED_EXTENSIONS = {
     'documents': ['.docx', '.doc', '.pdf'],
     'spreadsheets': ['.xlsx', '.xls'],
     'archives': ['.zip', '.7z', '.rar']
 }
 
-CSV_COLUMNS = [
-    'id', 'file_path', 'file_name', 'file_type', 'file_size',
-    'content', 'archive_path', 'created_date', 'content_hash'
-]
+# Precomputed lookups for the walk loop
+PARSEABLE_EXTENSIONS = frozenset(SUPPORTED_EXTENSIONS['documents'] + SUPPORTED_EXTENSIONS['spreadsheets'])
+SUPPORTED_SUFFIXES = tuple(PARSEABLE_EXTENSIONS) + tuple(SUPPORTED_EXTENSIONS['archives'])
 
+HASH_ALGORITHM = 'sha256'
+HASH_CHUNK_SIZE = 1 << 20
 
-def get_file_hash(file_path: str) -> str:
-    """Calculate MD5 hash of a file."""
-    hash_md5 = hashlib.md5()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
-    return hash_md5.hexdigest()
+WHITESPACE_RE = re.compile(r'\s+')
 
+CLEANUP_WORKERS = 8
 
-def get_file_size(file_path: str) -> int:
-    """Get file size in bytes."""
-    return os.path.getsize(file_path)
+_END_OF_TASKS = None  # queue sentinel sent by the task producer
+NESTED_ZIP_BATCH_SIZE = 64  # members of a nested ZIP handled per worker task
 
+OUTPUT_FORMATS = ('csv', 'parquet')
+PARQUET_ROW_GROUP_SIZE = 1000
 
-def get_file_dates(file_path: str):
-    """Get file creation and modification dates."""
-    stat = os.stat(file_path)
+CACHE_FILE_NAME = '.crawler_cache.sqlite'
+# Bump when parser output changes: rows cached by older parsers then live in
+# a table that is never read again
+CACHE_VERSION = 3
+CACHE_TABLE = f"parsed_v{CACHE_VERSION}"
+# The extension picks the parser, so the same bytes under another extension
+# are a different cache entry
+CACHE_SCHEMA_SQL = (f"CREATE TABLE IF NOT EXISTS {CACHE_TABLE} "
+                    "(hash TEXT, ext TEXT, content TEXT, PRIMARY KEY (hash, ext))")
+# Parser failures are retried on the next run rather than cached
+UNCACHEABLE_PREFIXES = ('[Error parsing', '[No text could be extracted')
+
+CSV_COLUMNS = [
+    'id', 'file_path', 'file_name', 'file_type', 'file_size',
+    'content', 'archive_path', 'created_date', 'content_hash'
+]
+
+
+def hash_open_file(f, file_size: int) -> str:
+    """Calculate SHA-256 hash of an already opened binary file."""
+    hash_sha = hashlib.new(HASH_ALGORITHM)
+    if file_size == 0:  # mmap cannot map empty files
+        return hash_sha.hexdigest()
+    try:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            hash_sha.update(mm)
+    except (OSError, ValueError):
+        # Not mappable (e.g. some network filesystems), read in chunks
+        f.seek(0)
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            hash_sha.update(chunk)
+    return hash_sha.hexdigest()
+
+
+def get_file_dates(file_path: str, stat: Optional[os.stat_result] = None):
+    """Get file creation and modification dates, reusing a stat result if given."""
+    if stat is None:
+        stat = os.stat(file_path)
     try:
         creation_time = stat.st_birthtime
     except AttributeError:
@@ -74,14 +137,18 @@ def clean_text(text: str) -> str:
     """Clean extracted text."""
     if not text:
         return ""
-    import re
-    return re.sub(r'\s+', ' ', text).strip().replace('\x00', '')
+    return WHITESPACE_RE.sub(' ', text.replace('\x00', '')).strip()
+
+
+def _source_name(source: Union[str, BinaryIO]) -> str:
+    """Name of a parser source (path or file object) for messages."""
+    return getattr(source, 'name', source)
 
 
-def parse_docx(file_path: str) -> str:
-    """Extract text from DOCX file."""
+def parse_docx(source: Union[str, BinaryIO]) -> str:
+    """Extract text from DOCX file (path or binary file object)."""
     try:
-        doc = Document(file_path)
+        doc = Document(source)
         parts = []
         for para in doc.paragraphs:
             if para.text.strip():
@@ -93,53 +160,63 @@ def parse_docx(file_path: str) -> str:
                     parts.append(" | ".join(cells))
         return clean_text("\n".join(parts))
     except Exception as e:
-        print(f"Error parsing DOCX {file_path}: {e}")
+        logger.warning("Error parsing DOCX %s: %s", _source_name(source), e)
         return f"[Error parsing DOCX: {e}]"
 
 
-def parse_xlsx(file_path: str) -> str:
-    """Extract text from XLSX file."""
+def _cell_text(value) -> str:
+    """Format a spreadsheet value; calamine returns whole numbers as floats."""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def parse_xlsx(source: Union[str, BinaryIO]) -> str:
+    """Extract text from XLSX file (path or binary file object)."""
     try:
-        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        wb = CalamineWorkbook.from_object(source)
         parts = []
-        for sheet_name in wb.sheetnames:
+        for sheet_name in wb.sheet_names:
             parts.append(f"[Sheet: {sheet_name}]")
-            sheet = wb[sheet_name]
-            for row in sheet.iter_rows(values_only=True):
-                row_vals = [str(cell) for cell in row if cell is not None]
+            for row in wb.get_sheet_by_name(sheet_name).to_python():
+                row_vals = [_cell_text(cell) for cell in row if cell != ""]
                 if row_vals:
                     parts.append(" | ".join(row_vals))
-        wb.close()
         return clean_text("\n".join(parts))
     except Exception as e:
-        print(f"Error parsing XLSX {file_path}: {e}")
+        logger.warning("Error parsing XLSX %s: %s", _source_name(source), e)
         return f"[Error parsing XLSX: {e}]"
 
 
-def parse_xls(file_path: str) -> str:
-    """Extract text from XLS file."""
+def parse_xls(source: Union[str, BinaryIO]) -> str:
+    """Extract text from XLS file (path or binary file object)."""
     try:
-        wb = xlrd.open_workbook(file_path)
+        if isinstance(source, str):
+            wb = xlrd.open_workbook(source)
+        else:
+            wb = xlrd.open_workbook(file_contents=source.read())
         parts = []
         for sheet in wb.sheets():
             parts.append(f"[Sheet: {sheet.name}]")
             for row_idx in range(sheet.nrows):
-                row_vals = [str(sheet.cell_value(row_idx, col_idx))
-                           for col_idx in range(sheet.ncols)
-                           if sheet.cell_value(row_idx, col_idx) is not None]
+                row_vals = [str(value) for value in sheet.row_values(row_idx)
+                            if value is not None]
                 if row_vals:
                     parts.append(" | ".join(row_vals))
         return clean_text("\n".join(parts))
     except Exception as e:
-        print(f"Error parsing XLS {file_path}: {e}")
+        logger.warning("Error parsing XLS %s: %s", _source_name(source), e)
         return f"[Error parsing XLS: {e}]"
 
 
-def parse_pdf_pypdf2(file_path: str) -> str:
+def parse_pdf_pypdf2(source: Union[str, BinaryIO]) -> str:
     """Extract text from PDF using PyPDF2."""
     try:
         parts = []
-        with open(file_path, 'rb') as f:
+        # Streams belong to the caller: rewind them but don't close them
+        opened = open(source, 'rb') if isinstance(source, str) else nullcontext(source)
+        with opened as f:
+            f.seek(0)
             reader = PyPDF2.PdfReader(f)
             for page_num, page in enumerate(reader.pages):
                 text = page.extract_text()
@@ -148,62 +225,58 @@ def parse_pdf_pypdf2(file_path: str) -> str:
                     parts.append(text)
         return clean_text("\n".join(parts))
     except Exception as e:
-        print(f"Error parsing PDF with PyPDF2 {file_path}: {e}")
+        logger.warning("Error parsing PDF with PyPDF2 %s: %s", _source_name(source), e)
         return ""
 
 
-def parse_pdf_pdfplumber(file_path: str) -> str:
-    """Extract text from PDF using pdfplumber."""
+def _parse_pdf_pdfium(source: Union[str, BinaryIO]):
+    """Extract text with PDFium. Returns (text, char_count); char_count is None on failure."""
     try:
         parts = []
-        with pdfplumber.open(file_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                text = page.extract_text()
+        char_count = 0
+        pdf = pdfium.PdfDocument(source)
+        try:
+            for page_num, page in enumerate(pdf, 1):
+                textpage = page.get_textpage()
+                char_count += textpage.count_chars()
+                text = textpage.get_text_range()
+                textpage.close()
+                page.close()
                 if text and text.strip():
                     parts.append(f"[Page {page_num}]")
                     parts.append(text)
-        return clean_text("\n".join(parts))
+        finally:
+            pdf.close()
+        return clean_text("\n".join(parts)), char_count
     except Exception as e:
-        print(f"Error parsing PDF with pdfplumber {file_path}: {e}")
-        return ""
+        logger.warning("Error parsing PDF with pypdfium2 %s: %s", _source_name(source), e)
+        return "", None
 
 
-def parse_pdf(file_path: str) -> str:
-    """Extract text from PDF, trying pdfplumber first then PyPDF2."""
-    text = parse_pdf_pdfplumber(file_path)
-    if len(text) < 50:
-        backup = parse_pdf_pypdf2(file_path)
+def parse_pdf(source: Union[str, BinaryIO]) -> str:
+    """Extract text from PDF (path or seekable binary file), trying PDFium first then PyPDF2."""
+    text, char_count = _parse_pdf_pdfium(source)
+    # A second parser only helps if PDFium failed or saw characters it could
+    # not extract; scanned PDFs have no text objects and would just be parsed twice
+    if char_count is None or (char_count > 0 and len(text) < 50):
+        backup = parse_pdf_pypdf2(source)
         if len(backup) > len(text):
             text = backup
     return text or "[No text could be extracted from PDF]"
 
 
-def parse_document(file_path: str, file_ext: str) -> str:
-    """Parse document and extract text."""
-    parsers = {
-        '.docx': parse_docx,
-        '.doc': parse_docx,
-        '.xlsx': parse_xlsx,
-        '.xls': parse_xls,
-        '.pdf': parse_pdf
-    }
-    parser = parsers.get(file_ext)
-    return parser(file_path) if parser else f"[Unsupported file type: {file_ext}]"
+PARSERS = {
+    '.docx': parse_docx,
+    '.doc': parse_docx,
+    '.xlsx': parse_xlsx,
+    '.xls': parse_xls,
+    '.pdf': parse_pdf
+}
 
 
-def extract_zip(archive_path: str, extract_dir: str):
-    """Extract ZIP archive."""
-    extracted = []
-    try:
-        with zipfile.ZipFile(archive_path, 'r') as zf:
-            zf.extractall(extract_dir)
-            for name in zf.namelist():
-                path = os.path.join(extract_dir, name)
-                if os.path.isfile(path):
-                    extracted.append(path)
-    except Exception as e:
-        print(f"Error extracting ZIP {archive_path}: {e}")
-    return extracted
+def file_extension(file_name: str) -> str:
+    """Lower-cased extension with leading dot; cheaper than os.path.splitext."""
+    return '.' + file_name.rpartition('.')[2].lower()
 
 
 def extract_7z(archive_path: str, extract_dir: str):
@@ -219,7 +292,7 @@ def extract_7z(archive_path: str, extract_dir: str):
                 if os.path.isfile(path):
                     extracted.append(path)
     except Exception as e:
-        print(f"Error extracting 7z {archive_path}: {e}")
+        logger.warning("Error extracting 7z %s: %s", archive_path, e)
     return extracted
 
 
@@ -236,134 +309,529 @@ def extract_rar(archive_path: str, extract_dir: str):
                 if os.path.isfile(path):
                     extracted.append(path)
     except Exception as e:
-        print(f"Error extracting RAR {archive_path}: {e}")
+        logger.warning("Error extracting RAR %s: %s", archive_path, e)
     return extracted
 
 
 def extract_archive(archive_path: str, extract_dir: str):
-    """Extract archive based on extension."""
+    """Extract a 7z or RAR archive based on extension; ZIPs are read in place."""
     ext = os.path.splitext(archive_path)[1].lower()
-    extractors = {'.zip': extract_zip, '.7z': extract_7z, '.rar': extract_rar}
+    extractors = {'.7z': extract_7z, '.rar': extract_rar}
     extractor = extractors.get(ext)
     if extractor:
         return extractor(archive_path, extract_dir)
-    print(f"Unsupported archive format: {ext}")
+    logger.warning("Unsupported archive format: %s", ext)
     return []
 
 
+# Read-only cache connections, one per worker process
+_cache_connections = {}
+
+
+def get_cached_content(cache_path: Optional[str], content_hash: str, file_ext: str) -> Optional[str]:
+    """Look up previously extracted content by file hash and extension."""
+    if not cache_path:
+        return None
+    conn = _cache_connections.get(cache_path)
+    if conn is None:
+        conn = _cache_connections[cache_path] = sqlite3.connect(cache_path)
+    row = conn.execute(f"SELECT content FROM {CACHE_TABLE} WHERE hash = ? AND ext = ?",
+                       (content_hash, file_ext)).fetchone()
+    return row[0] if row else None
+
+
+def _scan_files(root):
+    """Recursively yield os.DirEntry objects for all regular files under root.
+
+    Symlinks are not followed, so link loops cannot recurse forever, and
+    hidden directories such as .git are skipped without being listed.
+    Unreadable or vanished directories are skipped with a warning, as
+    os.walk does.
+    """
+    try:
+        it = os.scandir(root)
+    except OSError as e:
+        logger.warning("Cannot scan %s: %s", root, e)
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith('.'):
+                    yield from _scan_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+def open_zip_container(archive_path: str, chain: tuple) -> zipfile.ZipFile:
+    """Open the ZIP that directly holds a member.
+
+    chain names the nested ZIPs leading to it, outermost first; an empty
+    chain opens archive_path itself. Nested ZIPs are read into memory.
+    """
+    zf = zipfile.ZipFile(archive_path)
+    try:
+        for name in chain:
+            nested = zipfile.ZipFile(io.BytesIO(zf.read(name)))
+            zf.close()
+            zf = nested
+    except BaseException:
+        zf.close()
+        raise
+    return zf
+
+
+def read_zip_member(zf: zipfile.ZipFile, name: str):
+    """Read a member of an open ZIP into memory without extracting it to disk.
+
+    Returns (BytesIO, ZipInfo).
+    """
+    info = zf.getinfo(name)
+    source = io.BytesIO(zf.read(info))
+    source.name = name
+    return source, info
+
+
+def _process_file(file_path: str, file_ext: str, parser, archive_path: str = "",
+                  cache_path: Optional[str] = None,
+                  stat_result: Optional[os.stat_result] = None,
+                  members: tuple = (), logical_path: Optional[str] = None,
+                  container: Optional[zipfile.ZipFile] = None) -> Optional[dict]:
+    """Process a single file or, if members is given, a ZIP member.
+
+    logical_path is the row's file_path: the path under storage, through
+    any archives, rather than where the bytes were read from. container is
+    the open ZIP holding the member, see open_zip_container.
+
+    file_ext and parser are resolved once by the caller. Returns the document
+    row without its id, or None if a ZIP member cannot be read; the extra
+    'cached' key tells the caller whether content came from the cache.
+    """
+    file_name = os.path.basename(members[-1] if members else file_path)
+    if logical_path is None:
+        logical_path = os.path.join(file_path, *members)
+    
+    logger.debug("  Processing: %s", file_name)
+    
+    if members:
+        # A bad CRC, encryption or an unknown compression method only loses
+        # this member, not the whole crawl
+        try:
+            source, info = read_zip_member(container, members[-1])
+            content_hash = hashlib.new(HASH_ALGORITHM, source.getbuffer()).hexdigest()
+        except Exception as e:
+            logger.warning("Error reading ZIP member %s: %s", logical_path, e)
+            return None
+        file_size = info.file_size
+        created_date = datetime(*info.date_time).isoformat()
+    else:
+        source = file_path
+        # One open and at most one stat per file: size, dates and hash share them
+        with open(file_path, "rb") as f:
+            if stat_result is None:
+                stat_result = os.fstat(f.fileno())
+            file_size = stat_result.st_size
+            created_date, _ = get_file_dates(file_path, stat_result)
+            content_hash = hash_open_file(f, file_size)
+    content = get_cached_content(cache_path, content_hash, file_ext)
+    cached = content is not None
+    if not cached:
+        content = parser(source)
+    
+    file_type = 'document' if file_ext in SUPPORTED_EXTENSIONS['documents'] else 'spreadsheet'
+    
+    return {
+        'file_path': logical_path,
+        'file_name': file_name,
+        'file_type': file_type,
+        'file_size': file_size,
+        'content': content,
+        'archive_path': archive_path,
+        'created_date': created_date,
+        'content_hash': content_hash,
+        'cached': cached
+    }
+
+
+class TqdmStreamHandler(logging.StreamHandler):
+    """Stream handler that writes through tqdm.write, so records are printed
+    above an active progress bar instead of being glued onto it."""
+    
+    def emit(self, record):
+        try:
+            tqdm.write(self.format(record), file=self.stream)
+        except Exception:
+            self.handleError(record)
+
+
+def setup_logging(verbose: bool = False):
+    """Send crawler logs to stdout through a buffer flushed every LOG_BUFFER_SIZE records.
+
+    Warnings and errors flush the buffer immediately.
+    """
+    handler_class = TqdmStreamHandler if TQDM_AVAILABLE else logging.StreamHandler
+    target = handler_class(sys.stdout)
+    target.setFormatter(logging.Formatter(LOG_FORMAT))
+    logger.addHandler(logging.handlers.MemoryHandler(
+        LOG_BUFFER_SIZE, flushLevel=logging.WARNING, target=target))
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    logger.propagate = False
+
+
+def flush_logs():
+    """Write out records buffered by the crawler's log handlers."""
+    for handler in logger.handlers:
+        handler.flush()
+
+
+def _init_worker_logging(level: int, log_queue):
+    """Pool initializer: send worker records to the parent through log_queue.
+
+    The parent re-emits them through its own handlers, so worker and parent
+    output form one ordered stream. A forked worker must also not re-emit
+    records copied from the parent's buffer.
+    """
+    logger.handlers.clear()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(level)
+    logger.propagate = False
+
+
+class _WorkerLogListener(logging.handlers.QueueListener):
+    """Re-emit records from pool workers through the parent's crawler logger."""
+    
+    def handle(self, record):
+        logger.handle(record)
+
+
+def _process_batch_worker(jobs: tuple) -> list:
+    """Process pool entry point: run a batch of
+    (file_path, file_ext, parser, archive_path, cache_path, stat_result, members,
+    logical_path) jobs.
+
+    ZIP member jobs in one batch share their container, so a nested ZIP is
+    decompressed once per batch rather than once per member.
+    """
+    file_path, members = jobs[0][0], jobs[0][6]
+    if not members:
+        return [_process_file(*job) for job in jobs]
+    try:
+        container = open_zip_container(file_path, members[:-1])
+    except Exception as e:
+        logger.warning("Error reading ZIP %s: %s", os.path.join(file_path, *members[:-1]), e)
+        return []
+    with container:
+        return [_process_file(*job, container=container) for job in jobs]
+
+
+class CsvRowWriter:
+    """Stream document rows to a CSV file."""
+    
+    def __init__(self, path: Path):
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(CSV_COLUMNS)
+    
+    def write(self, doc: dict):
+        self._writer.writerow([doc[c] for c in CSV_COLUMNS])
+    
+    def close(self):
+        self._file.close()
+
+
+class ParquetRowWriter:
+    """Buffer rows column-wise and flush them as zstd-compressed Parquet row groups."""
+    
+    def __init__(self, path: Path, row_group_size: int = PARQUET_ROW_GROUP_SIZE):
+        if not PARQUET_AVAILABLE:
+            raise RuntimeError("pyarrow is required for Parquet output: pip install pyarrow")
+        self._schema = pa.schema([
+            ('id', pa.int64()), ('file_path', pa.string()), ('file_name', pa.string()),
+            ('file_type', pa.string()), ('file_size', pa.int64()), ('content', pa.string()),
+            ('archive_path', pa.string()), ('created_date', pa.string()),
+            ('content_hash', pa.string())
+        ])
+        self._writer = pq.ParquetWriter(str(path), self._schema, compression='zstd')
+        self._columns = {c: [] for c in CSV_COLUMNS}
+        self._rows = 0
+        self.row_group_size = row_group_size
+    
+    def write(self, doc: dict):
+        for column, values in self._columns.items():
+            values.append(doc[column])
+        self._rows += 1
+        if self._rows >= self.row_group_size:
+            self._flush()
+    
+    def _flush(self):
+        if not self._rows:
+            return
+        self._writer.write_table(pa.table(self._columns, schema=self._schema))
+        for values in self._columns.values():
+            values.clear()
+        self._rows = 0
+    
+    def close(self):
+        self._flush()
+        self._writer.close()
+
+
 class DocumentCrawler:
     """Crawler for extracting text from documents and archives."""
     
-    def __init__(self, storage_path: str, output_csv: str = "output/extracted_data.csv"):
+    def __init__(self, storage_path: str, output_csv: str = "output/extracted_data.csv",
+                 workers: Optional[int] = None, cache_path: Optional[str] = None,
+                 use_cache: bool = True, output_format: str = 'csv'):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
         self.storage_path = Path(storage_path)
         self.output_csv = Path(output_csv)
-        self.documents = []
+        self.output_format = output_format
+        self.workers = workers or os.cpu_count()
+        self.cache_path = None
+        if use_cache:
+            self.cache_path = Path(cache_path) if cache_path else self.output_csv.parent / CACHE_FILE_NAME
+        self.document_count = 0
         self.temp_dirs = []
     
-    def _process_file(self, file_path: str, archive_path: str = "") -> Optional[dict]:
-        """Process a single file."""
-        file_ext = os.path.splitext(file_path)[1].lower()
-        file_name = os.path.basename(file_path)
-        
-        supported = SUPPORTED_EXTENSIONS['documents'] + SUPPORTED_EXTENSIONS['spreadsheets']
-        if file_ext not in supported:
+    def _open_cache(self) -> Optional[sqlite3.Connection]:
+        """Open the parse cache. Workers read it, only this process writes."""
+        if not self.cache_path:
             return None
-        
-        print(f"  Processing: {file_name}")
-        
-        file_size = get_file_size(file_path)
-        created_date, _ = get_file_dates(file_path)
-        content_hash = get_file_hash(file_path)
-        content = parse_document(file_path, file_ext)
-        
-        file_type = 'document' if file_ext in SUPPORTED_EXTENSIONS['documents'] else 'spreadsheet'
-        
-        return {
-            'id': len(self.documents) + 1,
-            'file_path': file_path,
-            'file_name': file_name,
-            'file_type': file_type,
-            'file_size': file_size,
-            'content': content,
-            'archive_path': archive_path,
-            'created_date': created_date,
-            'content_hash': content_hash
-        }
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.cache_path)
+        conn.execute("PRAGMA journal_mode=WAL")  # readers don't block on writes
+        conn.execute(CACHE_SCHEMA_SQL)
+        conn.commit()
+        return conn
     
-    def _process_archive(self, archive_path: str, parent_path: str = "") -> list:
-        """Process archive and its contents recursively."""
-        results = []
+    def _process_archive(self, archive_path: str, parent_path: str = "",
+                         logical_path: Optional[str] = None):
+        """Yield batches of (file_path, file_ext, archive_path, stat, members, logical_path)
+        tasks from an archive recursively.
+
+        ZIP members are read in place by the workers; 7z and RAR archives
+        are extracted to a temporary directory. logical_path is the archive's
+        path under storage (archive_path itself unless it was extracted), so
+        member rows get stable paths instead of temporary ones.
+        """
+        if logical_path is None:
+            logical_path = archive_path
         archive_name = os.path.basename(archive_path)
         full_path = f"{parent_path}/{archive_name}" if parent_path else archive_name
-        print(f"\n  Extracting: {full_path}")
+        
+        if file_extension(archive_path) == '.zip':
+            logger.debug("  Reading: %s", full_path)
+            try:
+                with zipfile.ZipFile(archive_path, 'r') as zf:
+                    yield from self._process_zip(zf, archive_path, (), full_path, logical_path)
+            except Exception as e:
+                logger.warning("Error reading ZIP %s: %s", archive_path, e)
+            return
+        
+        logger.debug("  Extracting: %s", full_path)
         
         temp_dir = tempfile.mkdtemp(prefix="crawler_")
         self.temp_dirs.append(temp_dir)
         
         for extracted in extract_archive(archive_path, temp_dir):
-            ext = os.path.splitext(extracted)[1].lower()
+            ext = file_extension(extracted)
+            member_path = os.path.join(logical_path, os.path.relpath(extracted, temp_dir))
             if ext in SUPPORTED_EXTENSIONS['archives']:
-                results.extend(self._process_archive(extracted, full_path))
+                yield from self._process_archive(extracted, full_path, member_path)
+            elif ext in PARSEABLE_EXTENSIONS:
+                yield ((extracted, ext, full_path, None, (), member_path),)
+    
+    def _process_zip(self, zf: zipfile.ZipFile, archive_path: str, members: tuple,
+                     full_path: str, logical_path: str):
+        """Yield task batches for the members of an open ZIP without extracting it.
+
+        Members of the archive itself are one task each. Members of a nested
+        ZIP are batched, since every batch has to decompress that ZIP again.
+        """
+        batch = []
+        for info in zf.infolist():
+            if info.is_dir() or not info.filename.lower().endswith(SUPPORTED_SUFFIXES):
+                continue
+            ext = file_extension(info.filename)
+            chain = members + (info.filename,)
+            member_path = os.path.join(logical_path, *chain)
+            
+            if ext == '.zip':
+                nested_path = f"{full_path}/{os.path.basename(info.filename)}"
+                logger.debug("  Reading: %s", nested_path)
+                try:
+                    with zipfile.ZipFile(io.BytesIO(zf.read(info)), 'r') as nested:
+                        yield from self._process_zip(nested, archive_path, chain, nested_path, logical_path)
+                except Exception as e:
+                    logger.warning("Error reading ZIP %s: %s", nested_path, e)
+            elif ext in SUPPORTED_EXTENSIONS['archives']:
+                # 7z and RAR readers need a real file
+                temp_dir = tempfile.mkdtemp(prefix="crawler_")
+                self.temp_dirs.append(temp_dir)
+                try:
+                    extracted = zf.extract(info, temp_dir)
+                except Exception as e:
+                    logger.warning("Error extracting %s/%s: %s", full_path, info.filename, e)
+                    continue
+                yield from self._process_archive(extracted, full_path, member_path)
+            elif not members:
+                yield ((archive_path, ext, full_path, None, chain, member_path),)
             else:
-                doc = self._process_file(extracted, full_path)
-                if doc:
-                    results.append(doc)
-        
-        return results
+                batch.append((archive_path, ext, full_path, None, chain, member_path))
+                if len(batch) == NESTED_ZIP_BATCH_SIZE:
+                    yield tuple(batch)
+                    batch = []
+        if batch:
+            yield tuple(batch)
     
-    def crawl(self) -> list:
-        """Scan storage and extract content from all documents."""
-        print("=" * 60)
-        print("Starting crawler...")
-        print(f"Storage: {self.storage_path}")
-        print(f"Output: {self.output_csv}")
-        print()
-        
-        if not self.storage_path.exists():
-            print(f"Error: Storage path does not exist")
-            return []
+    def _collect_tasks(self):
+        """Walk storage and yield task batches for every parseable file, expanding archives."""
+        for entry in _scan_files(self.storage_path):
+            if not entry.name.lower().endswith(SUPPORTED_SUFFIXES):
+                continue
+            ext = file_extension(entry.name)
+            
+            logger.debug("Found: %s", entry.name)
+            
+            if ext in SUPPORTED_EXTENSIONS['archives']:
+                yield from self._process_archive(entry.path)
+            else:
+                yield ((entry.path, ext, "", entry.stat(), (), entry.path),)
+    
+    def _produce_tasks(self, tasks: queue.Queue, stop: threading.Event, errors: list):
+        """Producer thread: queue task batches as extraction finds them, then the sentinel."""
+        try:
+            for batch in self._collect_tasks():
+                if stop.is_set():
+                    return
+                tasks.put(batch)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            tasks.put(_END_OF_TASKS)
+    
+    def _open_writer(self):
+        """Open the row writer for the configured output format."""
+        if self.output_format == 'parquet':
+            return ParquetRowWriter(self.output_csv)
+        return CsvRowWriter(self.output_csv)
+    
+    def _write_document(self, doc: dict, writer, cache: Optional[sqlite3.Connection], progress=None):
+        """Assign the next id, write the row and cache freshly parsed content.
+
+        doc is None for ZIP members the worker could not read; they are skipped.
+        """
+        if doc is None:
+            return
+        self.document_count += 1
+        doc['id'] = self.document_count
+        writer.write(doc)
+        if progress is not None:
+            progress.update(1)
+        if cache and not doc['cached'] and not doc['content'].startswith(UNCACHEABLE_PREFIXES):
+            cache.execute(f"INSERT OR REPLACE INTO {CACHE_TABLE} (hash, ext, content) VALUES (?, ?, ?)",
+                          (doc['content_hash'], file_extension(doc['file_name']), doc['content']))
+    
+    def crawl(self) -> int:
+        """Scan storage and stream extracted content of all documents to the output file."""
+        logger.info("=" * 60)
+        logger.info("Starting crawler...")
+        logger.info("Storage: %s", self.storage_path)
+        logger.info("Output: %s", self.output_csv)
+        flush_logs()  # show the banner now, not when the buffer fills
         
-        for root, _, files in os.walk(self.storage_path):
-            for file_name in files:
-                file_path = os.path.join(root, file_name)
-                ext = os.path.splitext(file_path)[1].lower()
-                
-                print(f"\nFound: {file_name}")
-                
-                if ext in SUPPORTED_EXTENSIONS['archives']:
-                    self.documents.extend(self._process_archive(file_path))
-                else:
-                    doc = self._process_file(file_path)
-                    if doc:
-                        self.documents.append(doc)
+        self.document_count = 0
+        self.output_csv.parent.mkdir(parents=True, exist_ok=True)
         
-        self._cleanup()
+        writer = self._open_writer()
+        try:
+            if not self.storage_path.exists():
+                logger.error("Error: Storage path does not exist")
+                return 0
+            
+            cache = self._open_cache()
+            cache_path = str(self.cache_path) if cache else None
+            
+            # Walking and archive extraction (I/O-bound) run in a producer thread
+            # while the process pool parses (CPU-bound), so the two overlap. The
+            # bounded queue and in-flight window keep extraction from running
+            # far ahead and results from piling up in memory.
+            max_pending = self.workers * 4
+            tasks = queue.Queue(maxsize=max_pending)
+            stop = threading.Event()
+            errors = []
+            producer = threading.Thread(target=self._produce_tasks, args=(tasks, stop, errors),
+                                        name="crawler-producer", daemon=True)
+            pending = deque()
+            log_queue = multiprocessing.Queue()
+            log_listener = None
+            progress = tqdm(desc="Parsing", unit="file", mininterval=PROGRESS_INTERVAL) \
+                if TQDM_AVAILABLE else None
+            try:
+                with ProcessPoolExecutor(max_workers=self.workers,
+                                         initializer=_init_worker_logging,
+                                         initargs=(logger.getEffectiveLevel(), log_queue)) as executor:
+                    # The first submit forks the whole pool; do it before the producer
+                    # and log listener threads exist so no child inherits a lock
+                    # held by one of them
+                    executor.submit(int).result()
+                    log_listener = _WorkerLogListener(log_queue)
+                    log_listener.start()
+                    producer.start()
+                    for batch in iter(tasks.get, _END_OF_TASKS):
+                        # Bind each file's parser once here; workers get it with the task
+                        jobs = tuple((file_path, ext, PARSERS[ext], archive_path, cache_path,
+                                      stat_result, members, logical_path)
+                                     for file_path, ext, archive_path, stat_result, members, logical_path
+                                     in batch)
+                        pending.append(executor.submit(_process_batch_worker, jobs))
+                        # Rows are written in order as soon as the oldest batch finishes
+                        while pending and (len(pending) >= max_pending or pending[0].done()):
+                            for doc in pending.popleft().result():
+                                self._write_document(doc, writer, cache, progress)
+                    while pending:
+                        for doc in pending.popleft().result():
+                            self._write_document(doc, writer, cache, progress)
+                if errors:
+                    raise errors[0]
+            finally:
+                if log_listener is not None:
+                    log_listener.stop()  # drains what the finished workers sent
+                log_queue.close()
+                if progress is not None:
+                    progress.close()
+                stop.set()
+                while producer.is_alive():  # unblock a producer waiting on a full queue
+                    try:
+                        tasks.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+                self._cleanup()
+                if cache:
+                    cache.commit()
+                    cache.close()
+        finally:
+            writer.close()
         
-        print("\n" + "=" * 60)
-        print(f"Crawling complete! Processed {len(self.documents)} documents")
+        logger.info("=" * 60)
+        logger.info("Crawling complete! Processed %d documents", self.document_count)
+        logger.info("Exported to: %s", self.output_csv)
+        flush_logs()
         
-        return self.documents
+        return self.document_count
     
     def _cleanup(self):
-        """Remove temporary directories."""
-        for temp_dir in self.temp_dirs:
-            try:
-                shutil.rmtree(temp_dir)
-            except Exception as e:
-                print(f"Warning: Could not remove {temp_dir}: {e}")
+        """Remove temporary directories in parallel; rmtree is I/O-bound."""
+        def warn(func, path, exc_info):
+            logger.warning("Warning: Could not remove %s: %s", path, exc_info[1])
+        
+        if self.temp_dirs:
+            with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+                list(executor.map(lambda d: shutil.rmtree(d, onerror=warn), self.temp_dirs))
         self.temp_dirs.clear()
     
     def export(self) -> str:
-        """Export data to CSV."""
-        self.output_csv.parent.mkdir(parents=True, exist_ok=True)
-        print(f"\nExporting to: {self.output_csv}")
-        
-        with open(self.output_csv, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-            writer.writeheader()
-            writer.writerows(self.documents)
-        
-        print(f"Exported {len(self.documents)} documents")
+        """Return the output path. Kept for compatibility: rows are written by crawl()."""
         return str(self.output_csv)
     
     def run(self) -> str:
@@ -378,15 +846,30 @@ def main():
     
     parser = argparse.ArgumentParser(description='Document Crawler')
     parser.add_argument('--storage', '-s', default='storage', help='Storage directory')
-    parser.add_argument('--output', '-o', default='output/extracted_data.csv', help='Output CSV')
+    parser.add_argument('--output', '-o', default=None,
+                        help='Output file (default: output/extracted_data.csv or .parquet)')
+    parser.add_argument('--format', '-f', choices=OUTPUT_FORMATS, default='csv',
+                        help='Output format (default: csv, which import_to_db.py reads)')
+    parser.add_argument('--workers', '-w', type=int, default=None,
+                        help='Parser processes (default: CPU count)')
+    parser.add_argument('--cache', default=None,
+                        help=f'Parse cache file (default: {CACHE_FILE_NAME} next to the output CSV)')
+    parser.add_argument('--no-cache', action='store_true', help='Always re-parse every file')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Log every file found and processed')
     
     args = parser.parse_args()
-    crawler = DocumentCrawler(args.storage, args.output)
+    setup_logging(args.verbose)
+    if args.format == 'parquet' and not PARQUET_AVAILABLE:
+        logger.error("Error: pyarrow not available. Install it with: pip install pyarrow")
+        return 1
+    output = args.output or f"output/extracted_data.{args.format}"
+    crawler = DocumentCrawler(args.storage, output, args.workers,
+                              cache_path=args.cache, use_cache=not args.no_cache,
+                              output_format=args.format)
     csv_path = crawler.run()
-    print(f"\nDone! Output saved to: {csv_path}")
+    logger.info("Done! Output saved to: %s", csv_path)
     return 0
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
@@ -2,22 +2,32 @@
 # -*- coding: utf-8 -*-
 """Generate test documents for crawler testing."""
 
+import io
 import os
+import re
+import shutil
+import textwrap
 import random
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from xml.sax.saxutils import escape
 
 from docx import Document
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment
+from openpyxl.utils import get_column_letter
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.pdfgen import canvas
 import zipfile
 
 try:
     import py7zr
     SEVENZIP_AVAILABLE = True
+    # Fastest LZMA2 preset: the members are already-compressed documents
+    SEVENZIP_FILTERS = [{"id": py7zr.FILTER_LZMA2, "preset": 1}]
 except ImportError:
     SEVENZIP_AVAILABLE = False
 
@@ -27,13 +37,13 @@ try:
 except ImportError:
     RARFILE_AVAILABLE = False
 
-WORDS = [
+WORDS = (
     "document", "file", "data", "system", "program", "computer", "server", "database",
     "network", "internet", "application", "user", "security", "access", "report",
     "analysis", "table", "list", "search", "filter", "export", "import", "backup",
     "module", "library", "technology", "development", "testing", "project", "task",
     "meeting", "presentation", "training", "chapter", "section", "text", "content"
-]
+)
 
 TOPICS = [
     "Annual Report", "Financial Statement", "Project Plan", "Technical Specification",
@@ -46,179 +56,340 @@ COMPANIES = [
     "Digital Innovations", "Global Solutions Inc"
 ]
 
+# Date stamp written into every generated document
+DATE_FORMAT = '%d.%m.%Y'
+
+# Copy buffer for streaming files into archives
+COPY_CHUNK_SIZE = 1 << 20
+
+# PDF page layout (points) and characters per wrapped line
+PDF_MARGIN = 72
+PDF_BOTTOM_MARGIN = 18
+PDF_WRAP_WIDTH = 90
+
+# Stylesheet built once; the canvas only reads font metrics from it, so the
+# shared styles are never mutated
+_PDF_STYLES = getSampleStyleSheet()
+PDF_TITLE_STYLE = _PDF_STYLES['Heading1']
+PDF_HEADING_STYLE = _PDF_STYLES['Heading2']
+PDF_NORMAL_STYLE = _PDF_STYLES['Normal']
+PDF_BOLD_FONT = PDF_TITLE_STYLE.fontName
+
+DOCX_TABLE_COLS = 4
+DOCX_DOCUMENT_PART = 'word/document.xml'
+DOCX_HEADING_XML = '<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr><w:r><w:t>%s</w:t></w:r></w:p>'
+DOCX_PARAGRAPH_XML = '<w:p><w:r><w:t>%s</w:t></w:r></w:p>'
+DOCX_TABLE_STYLE_XML = '<w:tblStyle w:val="TableGrid"/>'
+
+
+def _build_docx_template():
+    """Build the placeholder DOCX once.
+
+    Returns the package members, document.xml with {{BODY}} and {{ROWS}}
+    markers, and the XML of one table cell with a %s slot for its text.
+    """
+    doc = Document()
+    doc.add_heading("{{TITLE}}", 0).alignment = 1
+    doc.add_paragraph("Company: {{COMPANY}}")
+    doc.add_paragraph("Date: {{DATE}}")
+    doc.add_paragraph()
+    doc.add_paragraph("{{BODY}}")
+    doc.add_heading("Data Table", 2)
+    doc.add_table(rows=1, cols=DOCX_TABLE_COLS)
+    
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    with zipfile.ZipFile(buffer) as zf:
+        members = [(name, zf.read(name)) for name in zf.namelist()]
+    
+    document_xml = dict(members)[DOCX_DOCUMENT_PART].decode('utf-8')
+    document_xml = document_xml.replace(DOCX_PARAGRAPH_XML % "{{BODY}}", "{{BODY}}")
+    # 'Table Grid' by style id, without python-docx's by-name style lookup
+    document_xml = document_xml.replace('<w:tblPr>', '<w:tblPr>' + DOCX_TABLE_STYLE_XML, 1)
+    row_xml = re.search(r'<w:tr>.*?</w:tr>', document_xml, re.S).group()
+    document_xml = document_xml.replace(row_xml, "{{ROWS}}")
+    cell_xml = re.search(r'<w:tc>.*?</w:tc>', row_xml, re.S).group()
+    cell_xml = cell_xml.replace('<w:p/>', DOCX_PARAGRAPH_XML)
+    return members, document_xml, cell_xml
+
+
+# Every DOCX is the same package with different text, so python-docx runs
+# once per process and documents are produced by filling in document.xml
+DOCX_MEMBERS, DOCX_DOCUMENT_XML, DOCX_CELL_XML = _build_docx_template()
+
+# Shared (immutable) openpyxl styles
+TITLE_FONT = Font(size=16, bold=True)
+SUMMARY_TITLE_FONT = Font(size=14, bold=True)
+BOLD_FONT = Font(bold=True)
+CENTER_ALIGNMENT = Alignment(horizontal='center')
+
+# Column letters for the narrow generated sheets
+_COLS = "ABCDEFGHIJ"
+
+
+# Words drawn per refill: enough for a whole generated document in one draw
+WORD_BATCH_SIZE = 4096
+
+
+class WordPool:
+    """Hands out random words from batches drawn with a single rng.choices call."""
+
+    def __init__(self, batch_size=WORD_BATCH_SIZE, rng=random):
+        self.batch_size = batch_size
+        # Bound once: these run in the innermost text-generation loops
+        self._choices = rng.choices
+        self._randint = rng.randint
+        self.words = []
+        self.pos = 0
+
+    def take(self, n):
+        """Return the next n random words."""
+        if self.pos + n > len(self.words):
+            self.words = self.words[self.pos:] + self._choices(WORDS, k=max(n, self.batch_size))
+            self.pos = 0
+        start = self.pos
+        self.pos += n
+        return self.words[start:self.pos]
+
+    def sentence(self, min_words=5, max_words=15):
+        """Generate random sentence."""
+        return " ".join(self.take(self._randint(min_words, max_words))).capitalize() + "."
+
+    def paragraph(self, min_sentences=3, max_sentences=7, min_words=5, max_words=15):
+        """Generate random paragraph."""
+        return " ".join(self.sentence(min_words, max_words)
+                        for _ in range(self._randint(min_sentences, max_sentences)))
 
-def random_sentence(min_words=5, max_words=15):
+
+def random_sentence(min_words=5, max_words=15, words=None, rng=random):
     """Generate random sentence."""
-    words = [random.choice(WORDS) for _ in range(random.randint(min_words, max_words))]
-    return " ".join(words).capitalize() + "."
+    return (words or WordPool(max_words, rng)).sentence(min_words, max_words)
 
 
-def random_paragraph(min_sentences=3, max_sentences=7):
+def random_paragraph(min_sentences=3, max_sentences=7, min_words=5, max_words=15,
+                     words=None, rng=random):
     """Generate random paragraph."""
-    return " ".join(random_sentence() for _ in range(random.randint(min_sentences, max_sentences)))
+    if words is None:
+        words = WordPool(max_sentences * max_words, rng)
+    return words.paragraph(min_sentences, max_sentences, min_words, max_words)
+
+
+# Header rows for the table widths the generators use
+HEADER_CACHE = {n: tuple(f"Column {i+1}" for i in range(n)) for n in (4, 5)}
 
 
-def random_table(rows=5, cols=4):
+def random_table(rows=5, cols=4, words=None, rng=random):
     """Generate random table data."""
-    data = [["Column " + str(i+1) for i in range(cols)]]
+    if words is None:
+        words = WordPool(rows * max(cols - 2, 0) * 4, rng)
+    header = HEADER_CACHE.get(cols) or tuple(f"Column {i+1}" for i in range(cols))
+    data = [list(header)]
     for _ in range(rows):
-        row = [f"Item {random.randint(1000, 9999)}"]
+        row = [f"Item {rng.randint(1000, 9999)}"]
         for j in range(1, cols-1):
-            row.append(random_sentence(2, 4))
-        row.append(f"{random.randint(100, 9999)}.{random.randint(0, 99):02d}")
+            row.append(words.sentence(2, 4))
+        row.append(f"{rng.randint(100, 9999)}.{rng.randint(0, 99):02d}")
         data.append(row)
     return data
 
 
-def create_docx(path, title=None):
-    """Create DOCX document."""
+def create_docx(path, title=None, rng=random, date_str=None):
+    """Create DOCX document from the placeholder template."""
     if title is None:
-        title = random.choice(TOPICS)
-    
-    doc = Document()
-    doc.add_heading(title, 0).alignment = 1
-    
-    company = random.choice(COMPANIES)
-    doc.add_paragraph(f"Company: {company}")
-    doc.add_paragraph(f"Date: {datetime.now().strftime('%d.%m.%Y')}")
-    doc.add_paragraph()
-    
-    for i in range(random.randint(2, 4)):
-        doc.add_heading(f"Section {i+1}: {random_sentence(2, 4)}", 1)
-        for _ in range(random.randint(2, 5)):
-            doc.add_paragraph(random_paragraph())
-    
-    doc.add_heading("Data Table", 2)
-    table_data = random_table(random.randint(3, 6), 4)
-    table = doc.add_table(rows=len(table_data), cols=len(table_data[0]))
-    table.style = 'Table Grid'
-    
-    for i, row in enumerate(table_data):
-        for j, cell in enumerate(row):
-            table.rows[i].cells[j].text = str(cell)
-    
-    doc.save(path)
-    print(f"Created: {path}")
+        title = rng.choice(TOPICS)
+    if date_str is None:
+        date_str = datetime.now().strftime(DATE_FORMAT)
+    
+    words = WordPool(rng=rng)
+    company = rng.choice(COMPANIES)
+    
+    body = []
+    for i in range(rng.randint(2, 4)):
+        body.append(DOCX_HEADING_XML % escape(f"Section {i+1}: {words.sentence(2, 4)}"))
+        for _ in range(rng.randint(2, 5)):
+            body.append(DOCX_PARAGRAPH_XML % escape(words.paragraph()))
+    
+    table_data = random_table(rng.randint(3, 6), DOCX_TABLE_COLS, words)
+    rows = "".join("<w:tr>" + "".join(DOCX_CELL_XML % escape(str(value)) for value in values) + "</w:tr>"
+                   for values in table_data)
+    
+    document_xml = (DOCX_DOCUMENT_XML
+                    .replace("{{TITLE}}", escape(title))
+                    .replace("{{COMPANY}}", escape(company))
+                    .replace("{{DATE}}", escape(date_str))
+                    .replace("{{BODY}}", "".join(body))
+                    .replace("{{ROWS}}", rows))
+    
+    # Fastest deflate: the styles parts alone are ~800 KB uncompressed, and
+    # archives store these files as-is
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for name, data in DOCX_MEMBERS:
+            if name == DOCX_DOCUMENT_PART:
+                data = document_xml.encode('utf-8')
+            zf.writestr(name, data)
     return path
 
 
-def create_xlsx(path, title=None):
+def _styled_cell(ws, value, font=None, alignment=None):
+    """Create a write-only cell, setting style only when needed."""
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
+
+
+def create_xlsx(path, title=None, rng=random, date_str=None):
     """Create XLSX document."""
     if title is None:
-        title = random.choice(TOPICS)
-    
-    wb = Workbook()
-    ws1 = wb.active
-    ws1.title = "Data"
-    
-    ws1['A1'] = title
-    ws1['A1'].font = Font(size=16, bold=True)
-    ws1.merge_cells('A1:E1')
-    
-    company = random.choice(COMPANIES)
-    ws1['A2'] = f"Company: {company}"
-    ws1['A3'] = f"Date: {datetime.now().strftime('%d.%m.%Y')}"
-    
-    table_data = random_table(random.randint(5, 10), 5)
-    start_row = 5
-    for i, row in enumerate(table_data):
-        for j, val in enumerate(row):
-            cell = ws1.cell(row=start_row+i, column=j+1, value=val)
-            if i == 0:
-                cell.font = Font(bold=True)
-                cell.alignment = Alignment(horizontal='center')
-    
-    # Adjust column widths
-    from openpyxl.utils import get_column_letter
-    for col in range(1, len(table_data[0])+1):
-        col_letter = get_column_letter(col)
-        max_len = max(len(str(ws1.cell(row=start_row+r, column=col).value or "")) 
-                     for r in range(len(table_data)))
+        title = rng.choice(TOPICS)
+    if date_str is None:
+        date_str = datetime.now().strftime(DATE_FORMAT)
+    
+    # Write-only workbook: rows are streamed to the XML writer instead of
+    # keeping a styled Cell object alive for every value
+    wb = Workbook(write_only=True)
+    ws1 = wb.create_sheet("Data")
+    
+    company = rng.choice(COMPANIES)
+    table_data = random_table(rng.randint(5, 10), 5, rng=rng)
+    
+    # Adjust column widths (must be set before rows are written)
+    for col, values in enumerate(zip(*table_data), 1):
+        max_len = max(len(str(val)) for val in values)
+        col_letter = _COLS[col-1] if col <= len(_COLS) else get_column_letter(col)
         ws1.column_dimensions[col_letter].width = min(max_len + 2, 50)
+    ws1.merged_cells.add('A1:E1')
+    
+    ws1.append([_styled_cell(ws1, title, TITLE_FONT)])
+    ws1.append([f"Company: {company}"])
+    ws1.append([f"Date: {date_str}"])
+    ws1.append([])
+    
+    ws1.append([_styled_cell(ws1, val, BOLD_FONT, CENTER_ALIGNMENT) for val in table_data[0]])
+    for row in table_data[1:]:
+        ws1.append(row)
     
     # Summary sheet
     ws2 = wb.create_sheet("Summary")
-    ws2['A1'] = "Summary Report"
-    ws2['A1'].font = Font(size=14, bold=True)
+    ws2.append([_styled_cell(ws2, "Summary Report", SUMMARY_TITLE_FONT)])
+    ws2.append([])
     
     summary = [
         ["Metric", "Value"],
-        ["Total Items", random.randint(100, 1000)],
-        ["Average Score", f"{random.randint(50, 100)}%"],
-        ["Status", random.choice(["Active", "Pending", "Completed"])]
+        ["Total Items", rng.randint(100, 1000)],
+        ["Average Score", f"{rng.randint(50, 100)}%"],
+        ["Status", rng.choice(["Active", "Pending", "Completed"])]
     ]
     
-    for i, row in enumerate(summary):
-        for j, val in enumerate(row):
-            cell = ws2.cell(row=i+3, column=j+1, value=val)
-            if i == 0:
-                cell.font = Font(bold=True)
+    ws2.append([_styled_cell(ws2, val, BOLD_FONT) for val in summary[0]])
+    for row in summary[1:]:
+        ws2.append(row)
     
     wb.save(path)
-    print(f"Created: {path}")
     return path
 
 
-def create_pdf(path, title=None):
-    """Create PDF document."""
+def create_pdf(path, title=None, rng=random, date_str=None):
+    """Create PDF document.
+
+    Lines are drawn straight onto a canvas: the platypus layout engine is
+    overkill for generated filler text.
+    """
     if title is None:
-        title = random.choice(TOPICS)
-    
-    doc = SimpleDocTemplate(path, pagesize=letter,
-                          rightMargin=72, leftMargin=72,
-                          topMargin=72, bottomMargin=18)
-    
-    story = []
-    styles = getSampleStyleSheet()
-    
-    title_style = styles['Heading1']
-    title_style.alignment = 1
-    story.append(Paragraph(title, title_style))
-    story.append(Spacer(1, 12))
-    
-    normal_style = styles['Normal']
-    company = random.choice(COMPANIES)
-    story.append(Paragraph(f"<b>Company:</b> {company}", normal_style))
-    story.append(Paragraph(f"<b>Date:</b> {datetime.now().strftime('%d.%m.%Y')}", normal_style))
-    story.append(Spacer(1, 24))
-    
-    for i in range(random.randint(2, 4)):
-        story.append(Paragraph(f"Section {i+1}: {random_sentence(2, 4)}", styles['Heading2']))
-        story.append(Spacer(1, 12))
-        for _ in range(random.randint(2, 4)):
-            story.append(Paragraph(random_paragraph(), normal_style))
-            story.append(Spacer(1, 12))
-    
-    doc.build(story)
-    print(f"Created: {path}")
+        title = rng.choice(TOPICS)
+    if date_str is None:
+        date_str = datetime.now().strftime(DATE_FORMAT)
+    
+    words = WordPool(rng=rng)
+    c = canvas.Canvas(os.fspath(path), pagesize=letter)
+    width, height = letter
+    y = height - PDF_MARGIN
+    
+    def advance(leading):
+        nonlocal y
+        y -= leading
+        if y < PDF_BOTTOM_MARGIN:
+            c.showPage()
+            y = height - PDF_MARGIN - leading
+    
+    def draw_lines(text, style):
+        c.setFont(style.fontName, style.fontSize)
+        for line in textwrap.wrap(text, PDF_WRAP_WIDTH):
+            advance(style.leading)
+            c.drawString(PDF_MARGIN, y, line)
+    
+    def draw_field(label, value):
+        advance(PDF_NORMAL_STYLE.leading)
+        c.setFont(PDF_BOLD_FONT, PDF_NORMAL_STYLE.fontSize)
+        c.drawString(PDF_MARGIN, y, label)
+        offset = c.stringWidth(label + " ", PDF_BOLD_FONT, PDF_NORMAL_STYLE.fontSize)
+        c.setFont(PDF_NORMAL_STYLE.fontName, PDF_NORMAL_STYLE.fontSize)
+        c.drawString(PDF_MARGIN + offset, y, value)
+    
+    advance(PDF_TITLE_STYLE.leading)
+    c.setFont(PDF_TITLE_STYLE.fontName, PDF_TITLE_STYLE.fontSize)
+    c.drawCentredString(width / 2, y, title)
+    y -= 12
+    
+    company = rng.choice(COMPANIES)
+    draw_field("Company:", company)
+    draw_field("Date:", date_str)
+    y -= 24
+    
+    for i in range(rng.randint(2, 4)):
+        draw_lines(f"Section {i+1}: {words.sentence(2, 4)}", PDF_HEADING_STYLE)
+        y -= 12
+        for _ in range(rng.randint(2, 4)):
+            draw_lines(words.paragraph(), PDF_NORMAL_STYLE)
+            y -= 12
+    
+    c.save()
     return path
 
 
+def _zip_file(zf, file_path, arcname):
+    """Stream a file from disk into an open ZipFile as a stored member."""
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+    zinfo.compress_type = zipfile.ZIP_STORED
+    with open(file_path, 'rb') as src, zf.open(zinfo, 'w') as dst:
+        shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+
+
 def create_zip(files, output_path):
-    """Create ZIP archive."""
-    with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for file_path in files:
-            if os.path.exists(file_path):
-                zf.write(file_path, os.path.basename(file_path))
-    print(f"Created: {output_path}")
+    """Create ZIP archive from (path, arcname) pairs.
+
+    Members are stored uncompressed: DOCX/XLSX/PDF are already compressed.
+    """
+    with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_STORED) as zf:
+        for file_path, arcname in files:
+            _zip_file(zf, file_path, arcname)
     return output_path
 
 
 def create_7z(files, output_path):
-    """Create 7z archive."""
+    """Create 7z archive from (path, arcname) pairs."""
     if not SEVENZIP_AVAILABLE:
         print("Warning: py7zr not available, skipping 7z")
         return None
     
-    with py7zr.SevenZipFile(output_path, 'w') as archive:
-        for file_path in files:
-            if os.path.exists(file_path):
-                archive.write(file_path, os.path.basename(file_path))
-    print(f"Created: {output_path}")
+    with py7zr.SevenZipFile(output_path, 'w', filters=SEVENZIP_FILTERS) as archive:
+        for file_path, arcname in files:
+            archive.write(file_path, arcname)
     return output_path
 
 
-def generate_all(output_dir="storage"):
+def _create_document(create, path, title, date_str):
+    """Pool task: build one document with its own freshly seeded RNG.
+
+    Forked workers inherit the parent's global RNG state, so every task
+    seeds a private random.Random from os.urandom instead.
+    """
+    return create(path, title, rng=random.Random(os.urandom(16)), date_str=date_str)
+
+
+def generate_all(output_dir="storage", workers=None):
     """Generate all test documents and archives."""
     docs_dir = Path(output_dir) / "documents"
     archives_dir = Path(output_dir) / "archives"
@@ -228,62 +399,75 @@ def generate_all(output_dir="storage"):
     
     created = {"docx": [], "xlsx": [], "pdf": [], "archives": []}
     
-    print("=" * 60)
-    print("Generating test documents...")
-    print("=" * 60)
+    print("\n".join(["=" * 60, "Generating test documents...", "=" * 60]))
     
-    # Generate documents
-    for i in range(random.randint(3, 4)):
-        title = random.choice(TOPICS)
-        created["docx"].append(create_docx(str(docs_dir / f"document_{i+1}_{title.replace(' ', '_')}.docx"), title))
+    date_str = datetime.now().strftime(DATE_FORMAT)
     
-    for i in range(random.randint(3, 4)):
-        title = random.choice(TOPICS)
-        created["xlsx"].append(create_xlsx(str(docs_dir / f"spreadsheet_{i+1}_{title.replace(' ', '_')}.xlsx"), title))
+    # Generate documents: each file is independent, so build them in parallel
+    tasks = []
+    for kind, prefix, create in [("docx", "document", create_docx),
+                                 ("xlsx", "spreadsheet", create_xlsx),
+                                 ("pdf", "report", create_pdf)]:
+        for i in range(random.randint(3, 4)):
+            title = random.choice(TOPICS)
+            path = docs_dir / f"{prefix}_{i+1}_{title.replace(' ', '_')}.{kind}"
+            tasks.append((kind, create, path, title))
     
-    for i in range(random.randint(3, 4)):
-        title = random.choice(TOPICS)
-        created["pdf"].append(create_pdf(str(docs_dir / f"report_{i+1}_{title.replace(' ', '_')}.pdf"), title))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [(kind, executor.submit(_create_document, create, path, title, date_str))
+                   for kind, create, path, title in tasks]
+        for kind, future in futures:
+            created[kind].append(future.result())
+    # Workers stay quiet; progress is reported in one write per stage
+    print("\n".join(f"Created: {path}" for _, _, path, _ in tasks))
     
     # Create archives
     print("\n--- Creating archives ---")
-    all_docs = created["docx"] + created["xlsx"] + created["pdf"]
+    all_docs = [(path, path.name) for path in created["docx"] + created["xlsx"] + created["pdf"]]
     
     if len(all_docs) >= 3:
         # ZIP archive
         files_for_zip = random.sample(all_docs, min(3, len(all_docs)))
         zip_path = archives_dir / "documents_archive.zip"
-        created["archives"].append(create_zip(files_for_zip, str(zip_path)))
+        created["archives"].append(create_zip(files_for_zip, zip_path))
         
         # 7z archive
         if SEVENZIP_AVAILABLE:
             files_for_7z = random.sample(all_docs, min(3, len(all_docs)))
             sevenzip_path = archives_dir / "documents_archive.7z"
-            created["archives"].append(create_7z(files_for_7z, str(sevenzip_path)))
+            created["archives"].append(create_7z(files_for_7z, sevenzip_path))
         
         # Nested archive
         if len(created["archives"]) > 0 and len(all_docs) >= 2:
             nested_files = random.sample(all_docs, 2)
-            nested_zip = archives_dir / "nested_docs.zip"
-            create_zip(nested_files, str(nested_zip))
+            # The inner archive is built in memory, never touching the disk
+            nested_zip = io.BytesIO()
+            with zipfile.ZipFile(nested_zip, 'w', zipfile.ZIP_STORED) as inner:
+                for file_path, arcname in nested_files:
+                    _zip_file(inner, file_path, arcname)
             
             outer_zip = archives_dir / "nested_archive.zip"
-            with zipfile.ZipFile(str(outer_zip), 'w', zipfile.ZIP_DEFLATED) as zf:
-                zf.write(str(nested_zip), "nested_docs.zip")
+            with zipfile.ZipFile(outer_zip, 'w', zipfile.ZIP_STORED) as zf:
+                zinfo = zipfile.ZipInfo("nested_docs.zip", datetime.now().timetuple()[:6])
+                zinfo.compress_type = zipfile.ZIP_STORED
+                zf.writestr(zinfo, nested_zip.getbuffer())
                 if all_docs:
-                    zf.write(random.choice(all_docs), os.path.basename(all_docs[0]))
+                    _zip_file(zf, random.choice(all_docs)[0], all_docs[0][1])
             
-            created["archives"].append(str(outer_zip))
-            print(f"Created nested archive: {outer_zip}")
-            os.remove(str(nested_zip))
-    
-    print("\n" + "=" * 60)
-    print("Generation complete!")
-    print(f"DOCX: {len(created['docx'])}")
-    print(f"XLSX: {len(created['xlsx'])}")
-    print(f"PDF: {len(created['pdf'])}")
-    print(f"Archives: {len(created['archives'])}")
-    print(f"Total: {sum(len(v) for v in created.values())}")
+            created["archives"].append(outer_zip)
+    
+    print("\n".join(f"Created: {path}" for path in created["archives"]))
+    
+    print("\n".join([
+        "",
+        "=" * 60,
+        "Generation complete!",
+        f"DOCX: {len(created['docx'])}",
+        f"XLSX: {len(created['xlsx'])}",
+        f"PDF: {len(created['pdf'])}",
+        f"Archives: {len(created['archives'])}",
+        f"Total: {sum(len(v) for v in created.values())}",
+    ]))
     
     return created
 
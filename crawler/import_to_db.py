@@ -78,10 +78,29 @@ CREATE_TABLE_SQL = """CREATE TABLE IF NOT EXISTS documents (
     archive_path TEXT,
     created_date TIMESTAMP,
     indexed_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    content_hash VARCHAR(32),
+    content_hash VARCHAR(64),
     search_vector tsvector
 );"""
 
+# Databases created before the switch from MD5 to SHA-256 have a 32-char column.
+# ALTER TABLE takes an ACCESS EXCLUSIVE lock, so only run it while the column
+# is still narrower than 64.
+WIDEN_HASH_COLUMN_SQL = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'documents'
+          AND column_name = 'content_hash'
+          AND character_maximum_length < 64
+    ) THEN
+        ALTER TABLE documents ALTER COLUMN content_hash TYPE VARCHAR(64);
+    END IF;
+END
+$$;
+"""
+
 CREATE_INDEXES_SQL = """
 CREATE INDEX IF NOT EXISTS idx_documents_file_type ON documents(file_type);
 CREATE INDEX IF NOT EXISTS idx_documents_file_name ON documents(file_name);
@@ -134,6 +153,7 @@ def setup_database(conn):
     print("Setting up database schema...")
     
     cursor.execute(CREATE_TABLE_SQL)
+    cursor.execute(WIDEN_HASH_COLUMN_SQL)
     cursor.execute(CREATE_INDEXES_SQL)
     cursor.execute(CREATE_TRIGGER_FUNCTION_SQL)
     cursor.execute(CREATE_TRIGGER_SQL)
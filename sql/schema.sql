@@ -39,7 +39,7 @@ CREATE TABLE documents (
     indexed_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,  -- When indexed
     
     -- Hash for deduplication
-    content_hash VARCHAR(32),          -- MD5 hash of content
+    content_hash VARCHAR(64),          -- SHA-256 hash of content
     
     -- Full-text search vector (automatically generated)
     search_vector tsvector
@@ -174,7 +174,7 @@ COMMENT ON COLUMN documents.content IS 'Extracted text content from the document
 COMMENT ON COLUMN documents.archive_path IS 'Path within archive if file was extracted from archive';
 COMMENT ON COLUMN documents.created_date IS 'Original file creation date';
 COMMENT ON COLUMN documents.indexed_date IS 'Date when document was indexed';
-COMMENT ON COLUMN documents.content_hash IS 'MD5 hash for deduplication';
+COMMENT ON COLUMN documents.content_hash IS 'SHA-256 hash for deduplication';
 COMMENT ON COLUMN documents.search_vector IS 'Full-text search vector (tsvector)';
 
 -- ============================================================================